@@ -11,6 +11,7 @@
 
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::fmt::Write;
 
 use crate::trace::{TraceEvent, EventType, DistributedTrace};
 use crate::{State, Transition, StateHash};
@@ -112,56 +113,57 @@ impl AnalysisEngine {
         
         // State information
         context.push_str("## State Before Divergence\n");
-        context.push_str(&format!("Clock: {}\n", state_before.clock));
-        context.push_str(&format!("Term: {}\n", state_before.term));
-        context.push_str(&format!("Leader: {:?}\n", state_before.leader));
-        context.push_str(&format!("Members: {:?}\n", state_before.members));
-        context.push_str(&format!("Data entries: {}\n\n", state_before.data.len()));
+        let _ = writeln!(context, "Clock: {}", state_before.clock);
+        let _ = writeln!(context, "Term: {}", state_before.term);
+        let _ = writeln!(context, "Leader: {:?}", state_before.leader);
+        let _ = writeln!(context, "Members: {:?}", state_before.members);
+        let _ = writeln!(context, "Data entries: {}\n", state_before.data.len());
         
         context.push_str("## State After Divergence\n");
-        context.push_str(&format!("Clock: {}\n", state_after.clock));
-        context.push_str(&format!("Term: {}\n", state_after.term));
-        context.push_str(&format!("Leader: {:?}\n", state_after.leader));
-        context.push_str(&format!("Members: {:?}\n", state_after.members));
-        context.push_str(&format!("Data entries: {}\n\n", state_after.data.len()));
+        let _ = writeln!(context, "Clock: {}", state_after.clock);
+        let _ = writeln!(context, "Term: {}", state_after.term);
+        let _ = writeln!(context, "Leader: {:?}", state_after.leader);
+        let _ = writeln!(context, "Members: {:?}", state_after.members);
+        let _ = writeln!(context, "Data entries: {}\n", state_after.data.len());
         
         // Causal chain
         context.push_str("## Causal Chain of Events\n");
-        context.push_str(&format!("Total events: {}\n\n", causal_chain.len()));
+        let _ = writeln!(context, "Total events: {}\n", causal_chain.len());
         
         for (i, event) in causal_chain.iter().enumerate() {
-            context.push_str(&format!(
-                "Event {}: [ID:{}] [Lamport:{}] [Node:{}]\n",
+            let _ = writeln!(
+                context,
+                "Event {}: [ID:{}] [Lamport:{}] [Node:{}]",
                 i + 1, event.id, event.lamport_clock, event.node_id
-            ));
+            );
             
             match &event.event_type {
                 EventType::Transition { transition } => {
-                    context.push_str(&format!("  Type: Transition\n"));
-                    context.push_str(&format!("  Detail: {}\n", transition));
+                    context.push_str("  Type: Transition\n");
+                    let _ = writeln!(context, "  Detail: {}", transition);
                 }
                 EventType::NetworkReceive { from, message_type } => {
-                    context.push_str(&format!("  Type: NetworkReceive\n"));
-                    context.push_str(&format!("  From: Node {}\n", from));
-                    context.push_str(&format!("  Message: {}\n", message_type));
+                    context.push_str("  Type: NetworkReceive\n");
+                    let _ = writeln!(context, "  From: Node {}", from);
+                    let _ = writeln!(context, "  Message: {}", message_type);
                 }
                 EventType::NetworkSend { to, message_type } => {
-                    context.push_str(&format!("  Type: NetworkSend\n"));
-                    context.push_str(&format!("  To: Node {}\n", to));
-                    context.push_str(&format!("  Message: {}\n", message_type));
+                    context.push_str("  Type: NetworkSend\n");
+                    let _ = writeln!(context, "  To: Node {}", to);
+                    let _ = writeln!(context, "  Message: {}", message_type);
                 }
                 EventType::Verification { passed, .. } => {
-                    context.push_str(&format!("  Type: Verification\n"));
-                    context.push_str(&format!("  Passed: {}\n", passed));
+                    context.push_str("  Type: Verification\n");
+                    let _ = writeln!(context, "  Passed: {}", passed);
                 }
                 EventType::TimerTick { timer_id } => {
-                    context.push_str(&format!("  Type: TimerTick\n"));
-                    context.push_str(&format!("  Timer: {}\n", timer_id));
+                    context.push_str("  Type: TimerTick\n");
+                    let _ = writeln!(context, "  Timer: {}", timer_id);
                 }
             }
             
             if !event.parents.is_empty() {
-                context.push_str(&format!("  Parents: {:?}\n", event.parents));
+                let _ = writeln!(context, "  Parents: {:?}", event.parents);
             }
             
             context.push_str("\n");
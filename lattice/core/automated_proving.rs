@@ -14,11 +14,20 @@
  */
 
 use std::collections::{HashMap, HashSet, VecDeque};
+use std::fmt::Write;
 use std::process::Command;
 use serde::{Serialize, Deserialize};
 
 use crate::{State, Transition};
 
+/// Strategies tried by `AutomatedProver::prove`, in order
+const PROOF_STRATEGIES: [ProofStrategy; 4] = [
+    ProofStrategy::SMTSolver,
+    ProofStrategy::Induction,
+    ProofStrategy::CaseAnalysis,
+    ProofStrategy::Contradiction,
+];
+
 /// Automated theorem prover
 pub struct AutomatedProver {
     /// SMT solver backend
@@ -31,7 +40,7 @@ pub struct AutomatedProver {
     lemmas: Vec<Lemma>,
     
     /// Proof cache
-    cache: HashMap<String, ProofResult>,
+    cache: HashMap<Theorem, ProofResult>,
 }
 
 impl AutomatedProver {
@@ -47,22 +56,14 @@ impl AutomatedProver {
     /// Prove a theorem automatically
     pub fn prove(&mut self, theorem: &Theorem) -> ProofResult {
         // Check cache
-        let key = format!("{:?}", theorem);
-        if let Some(cached) = self.cache.get(&key) {
+        if let Some(cached) = self.cache.get(theorem) {
             return cached.clone();
         }
         
         println!("[ATP] Attempting to prove: {}", theorem.name);
         
         // Try different proof strategies
-        let strategies = vec![
-            ProofStrategy::SMTSolver,
-            ProofStrategy::Induction,
-            ProofStrategy::CaseAnalysis,
-            ProofStrategy::Contradiction,
-        ];
-        
-        for strategy in strategies {
+        for strategy in PROOF_STRATEGIES {
             if let Some(proof) = self.try_strategy(theorem, strategy) {
                 println!("[ATP] ✓ Proved using {:?}", strategy);
                 let result = ProofResult {
@@ -71,7 +72,7 @@ impl AutomatedProver {
                     proof,
                     strategy,
                 };
-                self.cache.insert(key, result.clone());
+                self.cache.insert(theorem.clone(), result.clone());
                 return result;
             }
         }
@@ -258,14 +259,14 @@ impl SMTSolver {
 }
 
 /// Theorem to prove
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
 pub struct Theorem {
     pub name: String,
     pub statement: String,
     pub kind: TheoremKind,
 }
 
-#[derive(Debug, Clone, Copy)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
 pub enum TheoremKind {
     Safety,
     Liveness,
@@ -443,14 +444,16 @@ impl VerificationPipeline {
         output.push_str("=".repeat(80).as_str());
         output.push_str("\n\n");
         
-        output.push_str(&format!("Total theorems: {}\n", self.theorems.len()));
-        output.push_str(&format!("Proved: {}\n", self.results.values().filter(|r| r.proof_found).count()));
-        output.push_str(&format!("Failed: {}\n", self.results.values().filter(|r| !r.proof_found).count()));
+        let proved = self.results.values().filter(|r| r.proof_found).count();
+        
+        let _ = writeln!(output, "Total theorems: {}", self.theorems.len());
+        let _ = writeln!(output, "Proved: {}", proved);
+        let _ = writeln!(output, "Failed: {}", self.results.len() - proved);
         output.push_str("\n");
         
         for (name, result) in &self.results {
             let status = if result.proof_found { "✓" } else { "✗" };
-            output.push_str(&format!("{} {}\n", status, name));
+            let _ = writeln!(output, "{} {}", status, name);
         }
         
         output
@@ -72,33 +72,8 @@ pub struct ProofTerm {
     pub normalization: Vec<String>,
 }
 
-/// Coq theorem prover interface
-pub struct CoqProver {
-    /// Path to Coq installation
-    coqc_path: PathBuf,
-    
-    /// Working directory for proofs
-    work_dir: PathBuf,
-    
-    /// Proof cache
-    cache: HashMap<String, ProofCertificate>,
-}
-
-impl CoqProver {
-    pub fn new(work_dir: impl AsRef<Path>) -> std::io::Result<Self> {
-        let work_dir = work_dir.as_ref().to_path_buf();
-        std::fs::create_dir_all(&work_dir)?;
-        
-        Ok(CoqProver {
-            coqc_path: PathBuf::from("coqc"), // Assumes in PATH
-            work_dir,
-            cache: HashMap::new(),
-        })
-    }
-    
-    /// Generate Coq definition for State type
-    pub fn extract_state_definition(&self) -> String {
-        r#"
+/// Coq definition of the State type, shared by every proof file
+const COQ_STATE_DEFINITION: &str = r#"
 (* Formal definition of distributed state *)
 Require Import Coq.Lists.List.
 Require Import Coq.ZArith.ZArith.
@@ -143,12 +118,10 @@ Definition leader_in_members (s : State) : Prop :=
 (* Combined system invariant *)
 Definition system_invariant (s : State) : Prop :=
   members_unique s /\ leader_in_members s.
-"#.to_string()
-    }
-    
-    /// Generate Coq definition for Transition
-    pub fn extract_transition_definition(&self) -> String {
-        r#"
+"#;
+
+/// Coq definition of Transition and its semantics
+const COQ_TRANSITION_DEFINITION: &str = r#"
 (* Formal definition of state transitions *)
 Inductive Transition :=
   | Write : Key -> Value -> Transition
@@ -202,7 +175,40 @@ Fixpoint apply_transition (t : Transition) (s : State) : State :=
            data := data s' |}
       else s'
   end.
-"#.to_string()
+"#;
+
+/// Coq theorem prover interface
+pub struct CoqProver {
+    /// Path to Coq installation
+    coqc_path: PathBuf,
+    
+    /// Working directory for proofs
+    work_dir: PathBuf,
+    
+    /// Proof cache
+    cache: HashMap<String, ProofCertificate>,
+}
+
+impl CoqProver {
+    pub fn new(work_dir: impl AsRef<Path>) -> std::io::Result<Self> {
+        let work_dir = work_dir.as_ref().to_path_buf();
+        std::fs::create_dir_all(&work_dir)?;
+        
+        Ok(CoqProver {
+            coqc_path: PathBuf::from("coqc"), // Assumes in PATH
+            work_dir,
+            cache: HashMap::new(),
+        })
+    }
+    
+    /// Generate Coq definition for State type
+    pub fn extract_state_definition(&self) -> String {
+        COQ_STATE_DEFINITION.to_string()
+    }
+    
+    /// Generate Coq definition for Transition
+    pub fn extract_transition_definition(&self) -> String {
+        COQ_TRANSITION_DEFINITION.to_string()
     }
     
     /// Generate proof obligation for invariant preservation
@@ -250,8 +256,8 @@ Admitted. (* Complete proof requires more lemmas *)
         let proof_file = self.work_dir.join("transition_proof.v");
         
         let mut proof_content = String::new();
-        proof_content.push_str(&self.extract_state_definition());
-        proof_content.push_str(&self.extract_transition_definition());
+        proof_content.push_str(COQ_STATE_DEFINITION);
+        proof_content.push_str(COQ_TRANSITION_DEFINITION);
         proof_content.push_str(&self.generate_invariant_proof(transition));
         
         std::fs::write(&proof_file, proof_content)?;
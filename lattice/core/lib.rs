@@ -86,11 +86,13 @@ impl State {
     /// Compute cryptographic hash of state.
     /// 
     /// PERFORMANCE: Blake3 is fast (6GB/s) and collision-resistant.
+    /// The state is serialized straight into the hasher, so no intermediate
+    /// byte buffer is allocated.
     /// This is our "proof" that two states are identical.
     pub fn hash(&self) -> StateHash {
-        let bytes = bincode::serialize(self).expect("serialization never fails");
-        let hash = blake3::hash(&bytes);
-        StateHash(hash.as_bytes().clone())
+        let mut hasher = blake3::Hasher::new();
+        bincode::serialize_into(&mut hasher, self).expect("serialization never fails");
+        StateHash(*hasher.finalize().as_bytes())
     }
     
     /// Create a new empty state.
@@ -204,8 +206,14 @@ impl ShadowModel {
     }
     
     /// Get current state hash.
+    /// 
+    /// `apply` already records the hash of every state it produces, so
+    /// reuse the last one instead of reserializing the whole state.
     pub fn current_hash(&self) -> StateHash {
-        self.state.hash()
+        match self.history.last() {
+            Some(hash) => *hash,
+            None => self.state.hash(),
+        }
     }
 }
 
@@ -396,5 +404,8 @@ mod tests {
         
         // History should track both
         assert_eq!(shadow.history.len(), 2);
+        
+        // Current hash is the most recent one
+        assert_eq!(shadow.current_hash(), hash2);
     }
 }
@@ -14,6 +14,7 @@
  */
 
 use std::collections::{HashMap, VecDeque};
+use rand::Rng;
 use serde::{Serialize, Deserialize};
 
 use crate::monitoring::Metrics;
@@ -367,10 +368,11 @@ impl IsolationTree {
         }
         
         // Random feature and split
-        let feature = rand::random::<usize>() % data[0].len();
+        let mut rng = rand::thread_rng();
+        let feature = rng.gen_range(0..data[0].len());
         let min = data.iter().map(|x| x[feature]).fold(f64::INFINITY, f64::min);
         let max = data.iter().map(|x| x[feature]).fold(f64::NEG_INFINITY, f64::max);
-        let split = min + (max - min) * rand::random::<f64>();
+        let split = min + (max - min) * rng.gen::<f64>();
         
         // Split data
         let (left_data, right_data): (Vec<_>, Vec<_>) = data.iter()
@@ -455,12 +457,13 @@ struct Autoencoder {
 impl Autoencoder {
     fn new(input_size: usize, hidden_size: usize) -> Self {
         // Initialize with random weights
+        let mut rng = rand::thread_rng();
         let encoder_weights = (0..hidden_size)
-            .map(|_| (0..input_size).map(|_| rand::random::<f64>() - 0.5).collect())
+            .map(|_| (0..input_size).map(|_| rng.gen::<f64>() - 0.5).collect())
             .collect();
         
         let decoder_weights = (0..input_size)
-            .map(|_| (0..hidden_size).map(|_| rand::random::<f64>() - 0.5).collect())
+            .map(|_| (0..hidden_size).map(|_| rng.gen::<f64>() - 0.5).collect())
             .collect();
         
         Autoencoder {
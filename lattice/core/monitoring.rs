@@ -11,6 +11,7 @@
 
 use std::collections::HashMap;
 use std::sync::Arc;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::time::{Duration, Instant};
 use parking_lot::RwLock;
 use serde::{Serialize, Deserialize};
@@ -25,10 +26,28 @@ pub struct MetricsCollector {
     /// Metrics storage
     metrics: Arc<RwLock<Metrics>>,
     
+    /// Hot-path counters, bumped without taking the metrics lock and
+    /// folded into `snapshot()`
+    counters: Arc<Counters>,
+    
     /// Start time
     started_at: Instant,
 }
 
+/// Lock-free counters for events recorded on every message or error
+#[derive(Default)]
+struct Counters {
+    messages_sent: AtomicU64,
+    messages_received: AtomicU64,
+    bytes_sent: AtomicU64,
+    bytes_received: AtomicU64,
+    divergences: AtomicU64,
+    invariant_violations: AtomicU64,
+    network_errors: AtomicU64,
+    storage_errors: AtomicU64,
+    recovery_attempts: AtomicU64,
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Metrics {
     /// Verification metrics
@@ -212,6 +231,7 @@ impl MetricsCollector {
         MetricsCollector {
             node_id,
             metrics: Arc::new(RwLock::new(Metrics::default())),
+            counters: Arc::new(Counters::default()),
             started_at: Instant::now(),
         }
     }
@@ -242,16 +262,14 @@ impl MetricsCollector {
     
     /// Record message sent
     pub fn record_message_sent(&self, bytes: usize) {
-        let mut metrics = self.metrics.write();
-        metrics.network.messages_sent += 1;
-        metrics.network.bytes_sent += bytes as u64;
+        self.counters.messages_sent.fetch_add(1, Ordering::Relaxed);
+        self.counters.bytes_sent.fetch_add(bytes as u64, Ordering::Relaxed);
     }
     
     /// Record message received
     pub fn record_message_received(&self, bytes: usize) {
-        let mut metrics = self.metrics.write();
-        metrics.network.messages_received += 1;
-        metrics.network.bytes_received += bytes as u64;
+        self.counters.messages_received.fetch_add(1, Ordering::Relaxed);
+        self.counters.bytes_received.fetch_add(bytes as u64, Ordering::Relaxed);
     }
     
     /// Record election
@@ -262,7 +280,7 @@ impl MetricsCollector {
             metrics.consensus.elections_won += 1;
         }
         
-        let ms = duration.as_millis() as f64;
+        let ms = duration.as_secs_f64() * 1000.0;
         let n = metrics.consensus.elections as f64;
         let prev_avg = metrics.consensus.avg_election_time_ms;
         metrics.consensus.avg_election_time_ms = 
@@ -271,19 +289,33 @@ impl MetricsCollector {
     
     /// Record error
     pub fn record_error(&self, error_type: ErrorType) {
-        let mut metrics = self.metrics.write();
-        match error_type {
-            ErrorType::Divergence => metrics.errors.divergences += 1,
-            ErrorType::InvariantViolation => metrics.errors.invariant_violations += 1,
-            ErrorType::Network => metrics.errors.network_errors += 1,
-            ErrorType::Storage => metrics.errors.storage_errors += 1,
-            ErrorType::Recovery => metrics.errors.recovery_attempts += 1,
-        }
+        let counter = match error_type {
+            ErrorType::Divergence => &self.counters.divergences,
+            ErrorType::InvariantViolation => &self.counters.invariant_violations,
+            ErrorType::Network => &self.counters.network_errors,
+            ErrorType::Storage => &self.counters.storage_errors,
+            ErrorType::Recovery => &self.counters.recovery_attempts,
+        };
+        counter.fetch_add(1, Ordering::Relaxed);
     }
     
     /// Get current metrics snapshot
     pub fn snapshot(&self) -> Metrics {
-        self.metrics.read().clone()
+        let mut metrics = self.metrics.read().clone();
+        let c = &self.counters;
+        
+        metrics.network.messages_sent = c.messages_sent.load(Ordering::Relaxed);
+        metrics.network.messages_received = c.messages_received.load(Ordering::Relaxed);
+        metrics.network.bytes_sent = c.bytes_sent.load(Ordering::Relaxed);
+        metrics.network.bytes_received = c.bytes_received.load(Ordering::Relaxed);
+        
+        metrics.errors.divergences = c.divergences.load(Ordering::Relaxed);
+        metrics.errors.invariant_violations = c.invariant_violations.load(Ordering::Relaxed);
+        metrics.errors.network_errors = c.network_errors.load(Ordering::Relaxed);
+        metrics.errors.storage_errors = c.storage_errors.load(Ordering::Relaxed);
+        metrics.errors.recovery_attempts = c.recovery_attempts.load(Ordering::Relaxed);
+        
+        metrics
     }
     
     /// Get uptime
@@ -378,7 +410,7 @@ impl HealthChecker {
         let healthy = checks.values().all(|c| c.passed);
         let status = if healthy { "OK" } else { "DEGRADED" };
         
-        HealthStatus {
+        let result = HealthStatus {
             node_id: self.node_id,
             healthy,
             status: status.to_string(),
@@ -387,7 +419,12 @@ impl HealthChecker {
                 .duration_since(std::time::UNIX_EPOCH)
                 .unwrap()
                 .as_secs(),
-        }
+        };
+        
+        // Publish so get_status reflects the latest check
+        *self.status.write() = result.clone();
+        
+        result
     }
     
     /// Get current health status
@@ -538,6 +575,13 @@ impl AlertManager {
 pub struct DistributedTracer {
     /// Active traces
     traces: Arc<RwLock<HashMap<TraceId, Trace>>>,
+    
+    /// Random high half of every trace ID, drawn once per tracer so IDs
+    /// stay distinct across nodes
+    id_prefix: u64,
+    
+    /// Low half of the next trace ID
+    next_id: AtomicU64,
 }
 
 pub type TraceId = u128;
@@ -562,12 +606,15 @@ impl DistributedTracer {
     pub fn new() -> Self {
         DistributedTracer {
             traces: Arc::new(RwLock::new(HashMap::new())),
+            id_prefix: rand::random(),
+            next_id: AtomicU64::new(0),
         }
     }
     
     /// Start a new trace
     pub fn start_trace(&self) -> TraceId {
-        let id = rand::random();
+        let seq = self.next_id.fetch_add(1, Ordering::Relaxed);
+        let id = ((self.id_prefix as TraceId) << 64) | seq as TraceId;
         let trace = Trace {
             id,
             started_at: Instant::now(),
@@ -608,6 +655,60 @@ mod tests {
         assert!(metrics.verification.avg_time_us > 0.0);
     }
     
+    #[test]
+    fn test_counters_in_snapshot() {
+        let collector = MetricsCollector::new(1);
+        
+        collector.record_message_sent(100);
+        collector.record_message_sent(50);
+        collector.record_message_received(10);
+        collector.record_error(ErrorType::Divergence);
+        
+        let metrics = collector.snapshot();
+        assert_eq!(metrics.network.messages_sent, 2);
+        assert_eq!(metrics.network.bytes_sent, 150);
+        assert_eq!(metrics.network.bytes_received, 10);
+        assert_eq!(metrics.errors.divergences, 1);
+    }
+    
+    #[tokio::test]
+    async fn test_health_check_updates_status() {
+        let checker = HealthChecker::new(1);
+        
+        let mut metrics = Metrics::default();
+        metrics.verification.total = 10;
+        metrics.verification.failed = 10;
+        
+        let result = checker.check_health(&metrics).await;
+        assert!(!result.healthy);
+        
+        let status = checker.get_status();
+        assert!(!status.healthy);
+        assert_eq!(status.status, "DEGRADED");
+    }
+    
+    #[test]
+    fn test_election_time_keeps_sub_millisecond() {
+        let collector = MetricsCollector::new(1);
+        
+        collector.record_election(Duration::from_micros(1500), true);
+        
+        let metrics = collector.snapshot();
+        assert!((metrics.consensus.avg_election_time_ms - 1.5).abs() < 1e-9);
+    }
+    
+    #[test]
+    fn test_trace_ids_unique() {
+        let tracer = DistributedTracer::new();
+        
+        let a = tracer.start_trace();
+        let b = tracer.start_trace();
+        
+        assert_ne!(a, b);
+        assert!(tracer.get_trace(a).is_some());
+        assert!(tracer.get_trace(b).is_some());
+    }
+    
     #[test]
     fn test_alert_manager() {
         let mut mgr = AlertManager::new();
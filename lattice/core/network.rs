@@ -127,14 +127,10 @@ impl NetworkLayer {
         
         // Send message
         if let Some(Ok(mut stream)) = conn {
-            let bytes = serialize_message(&msg)?;
+            let frame = serialize_message(&msg)?;
             
-            // Write length prefix
-            stream.write_u32(bytes.len() as u32).await
-                .map_err(|e| NetworkError::SendError(e.to_string()))?;
-            
-            // Write message
-            stream.write_all(&bytes).await
+            // Write length prefix and message in a single write
+            stream.write_all(&frame).await
                 .map_err(|e| NetworkError::SendError(e.to_string()))?;
             
             stream.flush().await
@@ -184,10 +180,20 @@ async fn handle_connection(
     }
 }
 
-/// Serialize a message
+/// Serialize a message into a length-prefixed frame.
+/// 
+/// The big-endian u32 prefix (what `read_u32` expects) is reserved up front
+/// and patched after encoding, so the frame goes out in one write instead of
+/// a separate 4-byte segment that can stall behind Nagle's algorithm.
 fn serialize_message(msg: &RaftMessage) -> Result<Vec<u8>, NetworkError> {
-    bincode::serialize(msg)
-        .map_err(|e| NetworkError::SerializeError(e.to_string()))
+    let mut frame = vec![0u8; 4];
+    bincode::serialize_into(&mut frame, msg)
+        .map_err(|e| NetworkError::SerializeError(e.to_string()))?;
+    
+    let len = (frame.len() - 4) as u32;
+    frame[..4].copy_from_slice(&len.to_be_bytes());
+    
+    Ok(frame)
 }
 
 /// Deserialize a message
@@ -222,3 +228,32 @@ impl std::fmt::Display for NetworkError {
 }
 
 impl std::error::Error for NetworkError {}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::raft::MessagePayload;
+    
+    #[test]
+    fn test_message_frame_roundtrip() {
+        let msg = RaftMessage {
+            from: 1,
+            to: 2,
+            payload: MessagePayload::RequestVote {
+                term: 3,
+                candidate_id: 1,
+                last_log_index: 10,
+                last_log_term: 2,
+            },
+        };
+        
+        let frame = serialize_message(&msg).unwrap();
+        
+        // Prefix is the big-endian payload length that read_u32 expects
+        let len = u32::from_be_bytes(frame[..4].try_into().unwrap());
+        assert_eq!(len, (frame.len() - 4) as u32);
+        
+        let decoded = deserialize_message(&frame[4..]).unwrap();
+        assert_eq!(format!("{:?}", decoded), format!("{:?}", msg));
+    }
+}
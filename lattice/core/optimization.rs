@@ -10,7 +10,7 @@
  * - Memory pooling
  */
 
-use std::collections::{HashMap, VecDeque};
+use std::collections::{BTreeMap, HashMap, VecDeque};
 use std::sync::Arc;
 use parking_lot::RwLock;
 use std::time::{Duration, Instant};
@@ -70,8 +70,8 @@ impl BatchProcessor {
 
 /// State cache - Avoid redundant hash computations
 pub struct StateCache {
-    /// Cache
-    cache: Arc<RwLock<HashMap<u64, StateHash>>>,
+    /// Cache, ordered by logical clock so the oldest entry is always first
+    cache: Arc<RwLock<BTreeMap<u64, StateHash>>>,
     
     /// Max entries
     max_entries: usize,
@@ -80,7 +80,7 @@ pub struct StateCache {
 impl StateCache {
     pub fn new(max_entries: usize) -> Self {
         StateCache {
-            cache: Arc::new(RwLock::new(HashMap::new())),
+            cache: Arc::new(RwLock::new(BTreeMap::new())),
             max_entries,
         }
     }
@@ -94,11 +94,9 @@ impl StateCache {
     pub fn put(&self, clock: u64, hash: StateHash) {
         let mut cache = self.cache.write();
         
-        // Evict oldest if full
+        // Evict oldest if full (O(log n), no scan over every key)
         if cache.len() >= self.max_entries {
-            if let Some(&oldest) = cache.keys().min() {
-                cache.remove(&oldest);
-            }
+            cache.pop_first();
         }
         
         cache.insert(clock, hash);
@@ -349,10 +347,14 @@ pub struct ProfilerGuard {
 impl Drop for ProfilerGuard {
     fn drop(&mut self) {
         let duration = self.start.elapsed();
-        self.samples.write()
-            .entry(self.name.clone())
-            .or_insert_with(Vec::new)
-            .push(duration);
+        let mut samples = self.samples.write();
+        
+        // Look up by &str first so repeat samples don't allocate a key
+        if let Some(durations) = samples.get_mut(self.name.as_str()) {
+            durations.push(duration);
+        } else {
+            samples.insert(std::mem::take(&mut self.name), vec![duration]);
+        }
     }
 }
 
@@ -403,4 +405,29 @@ mod tests {
         assert_eq!(cache.get(1), Some(hash));
         assert_eq!(cache.get(2), None);
     }
+    
+    #[test]
+    fn test_state_cache_evicts_oldest() {
+        let cache = StateCache::new(2);
+        
+        cache.put(3, StateHash([3; 32]));
+        cache.put(1, StateHash([1; 32]));
+        cache.put(2, StateHash([2; 32]));
+        
+        assert_eq!(cache.get(1), None);
+        assert_eq!(cache.get(2), Some(StateHash([2; 32])));
+        assert_eq!(cache.get(3), Some(StateHash([3; 32])));
+    }
+    
+    #[test]
+    fn test_profiler_records_samples() {
+        let profiler = Profiler::new();
+        
+        for _ in 0..3 {
+            let _guard = profiler.start("verify");
+        }
+        
+        assert_eq!(profiler.stats("verify").unwrap().count, 3);
+        assert!(profiler.stats("other").is_none());
+    }
 }
@@ -9,7 +9,7 @@
  * - Automatic failover
  */
 
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 use std::time::{Duration, Instant};
 use serde::{Serialize, Deserialize};
 
@@ -74,25 +74,25 @@ impl RecoveryManager {
         
         // Step 2: Replay WAL entries
         self.state = RecoveryState::Replaying;
-        let entries = self.wal.read_all()?;
-        
-        println!("[Recovery] Replaying {} WAL entries", entries.len());
-        
-        for (i, entry) in entries.iter().enumerate() {
+        let mut replayed = 0;
+        let total = self.wal.for_each_entry(|entry| {
             match entry {
                 crate::storage::WALEntry::LogEntry { transition, .. } => {
-                    state = transition.apply(state);
+                    state = transition.apply(std::mem::replace(&mut state, State::new()));
                 }
                 crate::storage::WALEntry::Snapshot { state: snap_state, .. } => {
-                    state = snap_state.clone();
+                    state = snap_state;
                 }
                 _ => {} // Metadata entries don't affect state
             }
             
-            if (i + 1) % 1000 == 0 {
-                println!("[Recovery] Replayed {}/{} entries", i + 1, entries.len());
+            replayed += 1;
+            if replayed % 1000 == 0 {
+                println!("[Recovery] Replayed {} entries", replayed);
             }
-        }
+        })?;
+        
+        println!("[Recovery] Replayed {} WAL entries", total);
         
         println!("[Recovery] ✅ Recovery complete");
         self.state = RecoveryState::Normal;
@@ -260,7 +260,7 @@ pub struct FailoverManager {
     primary: Option<NodeId>,
     
     /// Backup nodes in priority order
-    backups: Vec<NodeId>,
+    backups: VecDeque<NodeId>,
     
     /// Failover history
     history: Vec<FailoverEvent>,
@@ -286,7 +286,7 @@ impl FailoverManager {
     pub fn new(backups: Vec<NodeId>) -> Self {
         FailoverManager {
             primary: None,
-            backups,
+            backups: backups.into(),
             history: Vec::new(),
         }
     }
@@ -296,15 +296,12 @@ impl FailoverManager {
         let old_primary = self.primary;
         
         // Select next backup
-        if let Some(new_primary) = self.backups.first().copied() {
+        if let Some(new_primary) = self.backups.pop_front() {
             self.primary = Some(new_primary);
             
             // Move old primary to end of backups if it exists
             if let Some(old) = old_primary {
-                self.backups.retain(|&id| id != new_primary);
-                self.backups.push(old);
-            } else {
-                self.backups.remove(0);
+                self.backups.push_back(old);
             }
             
             let event = FailoverEvent {
@@ -540,6 +537,17 @@ mod tests {
         assert!(!cb.allow_request());
     }
     
+    #[test]
+    fn test_failover_rotates_backups() {
+        let mut mgr = FailoverManager::new(vec![2, 3]);
+        
+        assert_eq!(mgr.failover(FailoverReason::ManualFailover), Some(2));
+        assert_eq!(mgr.failover(FailoverReason::ManualFailover), Some(3));
+        assert_eq!(mgr.failover(FailoverReason::ManualFailover), Some(2));
+        assert_eq!(mgr.current_primary(), Some(2));
+        assert_eq!(mgr.get_history().len(), 3);
+    }
+    
     #[test]
     fn test_retry_policy() {
         let policy = RetryPolicy::exponential(100, 5);
@@ -9,7 +9,8 @@
  * - Audit logging
  */
 
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
+use std::time::{Duration, Instant};
 use serde::{Serialize, Deserialize};
 use blake3::Hasher;
 
@@ -153,7 +154,8 @@ pub enum Action {
 
 /// Audit logger - Records all security events
 pub struct AuditLog {
-    entries: Vec<AuditEntry>,
+    /// Ring buffer of the most recent entries
+    entries: VecDeque<AuditEntry>,
     max_entries: usize,
 }
 
@@ -176,7 +178,7 @@ pub enum AuditResult {
 impl AuditLog {
     pub fn new(max_entries: usize) -> Self {
         AuditLog {
-            entries: Vec::new(),
+            entries: VecDeque::new(),
             max_entries,
         }
     }
@@ -188,11 +190,11 @@ impl AuditLog {
             entry.timestamp, entry.node_id, entry.action, entry.result
         );
         
-        self.entries.push(entry);
+        self.entries.push_back(entry);
         
-        // Keep bounded
+        // Keep bounded (O(1) eviction, no shifting)
         if self.entries.len() > self.max_entries {
-            self.entries.remove(0);
+            self.entries.pop_front();
         }
     }
     
@@ -214,13 +216,13 @@ impl AuditLog {
 /// Rate limiter - Prevent abuse
 pub struct RateLimiter {
     /// Requests per node
-    requests: HashMap<NodeId, Vec<u64>>,
+    requests: HashMap<NodeId, Vec<Instant>>,
     
     /// Max requests per window
     max_requests: usize,
     
-    /// Window size (seconds)
-    window_seconds: u64,
+    /// Window size
+    window: Duration,
 }
 
 impl RateLimiter {
@@ -228,22 +230,20 @@ impl RateLimiter {
         RateLimiter {
             requests: HashMap::new(),
             max_requests,
-            window_seconds,
+            window: Duration::from_secs(window_seconds),
         }
     }
     
     /// Check if request is allowed
     pub fn allow(&mut self, node_id: NodeId) -> bool {
-        let now = std::time::SystemTime::now()
-            .duration_since(std::time::UNIX_EPOCH)
-            .unwrap()
-            .as_secs();
+        // Monotonic clock: wall-clock jumps must not reopen or stall the window
+        let now = Instant::now();
         
         let timestamps = self.requests.entry(node_id).or_insert_with(Vec::new);
         
         // Remove old timestamps
-        let cutoff = now - self.window_seconds;
-        timestamps.retain(|&ts| ts > cutoff);
+        let window = self.window;
+        timestamps.retain(|&ts| now.duration_since(ts) < window);
         
         // Check limit
         if timestamps.len() >= self.max_requests {
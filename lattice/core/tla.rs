@@ -13,6 +13,7 @@
  */
 
 use std::collections::{HashMap, HashSet};
+use std::fmt::Write;
 use serde::{Serialize, Deserialize};
 
 use crate::{State, Transition, NodeId};
@@ -269,7 +270,8 @@ pub struct TLAChecker {
     /// State history for liveness checking
     history: Vec<State>,
     
-    /// Maximum history size
+    /// Maximum history size passed to specs. The buffer is trimmed lazily,
+    /// so up to `2 * max_history` states are held in memory at once.
     max_history: usize,
 }
 
@@ -301,16 +303,21 @@ impl TLAChecker {
         // Add to history
         self.history.push(state.clone());
         
-        // Keep history bounded
-        if self.history.len() > self.max_history {
-            self.history.remove(0);
+        // Keep history bounded. Trimming only once the buffer reaches twice
+        // the limit makes eviction amortized O(1) instead of shifting every
+        // state on each check; specs always see the last `max_history` states.
+        if self.history.len() > 2 * self.max_history {
+            let excess = self.history.len() - self.max_history;
+            self.history.drain(..excess);
         }
+        let start = self.history.len().saturating_sub(self.max_history);
+        let history = &self.history[start..];
         
         let mut violations = Vec::new();
         
         // Check each spec
         for spec in &self.specs {
-            if let Err(violation) = spec.check(state, &self.history) {
+            if let Err(violation) = spec.check(state, history) {
                 println!(
                     "[TLA+] ❌ Specification violated: {} - {}",
                     spec.name(),
@@ -336,16 +343,17 @@ impl TLAChecker {
     pub fn generate_counterexample(&self, violation: &SpecViolation) -> String {
         let mut output = String::new();
         
-        output.push_str(&format!("=== TLA+ Counterexample ===\n"));
-        output.push_str(&format!("Specification: {}\n", violation.spec_name));
-        output.push_str(&format!("Violation: {}\n\n", violation.message));
+        output.push_str("=== TLA+ Counterexample ===\n");
+        let _ = writeln!(output, "Specification: {}", violation.spec_name);
+        let _ = writeln!(output, "Violation: {}\n", violation.message);
         
         output.push_str("State trace:\n");
         for (i, state) in violation.counterexample.iter().enumerate() {
-            output.push_str(&format!(
-                "State {}: clock={}, term={}, leader={:?}\n",
+            let _ = writeln!(
+                output,
+                "State {}: clock={}, term={}, leader={:?}",
                 i, state.clock, state.term, state.leader
-            ));
+            );
         }
         
         output
@@ -444,4 +452,49 @@ mod tests {
         // This would fail if specs are violated
         assert!(tester.run_tests(100).is_ok());
     }
+    
+    /// Records the clocks of the history each check is given
+    struct HistoryRecorder {
+        seen: std::sync::Arc<parking_lot::Mutex<Vec<Vec<u64>>>>,
+    }
+    
+    impl TLASpec for HistoryRecorder {
+        fn name(&self) -> &str {
+            "HistoryRecorder"
+        }
+        
+        fn check(&self, _state: &State, history: &[State]) -> Result<(), SpecViolation> {
+            self.seen.lock().push(history.iter().map(|s| s.clock).collect());
+            Ok(())
+        }
+        
+        fn spec_type(&self) -> SpecType {
+            SpecType::Liveness
+        }
+    }
+    
+    #[test]
+    fn test_check_all_passes_last_max_history_states() {
+        let max_history = 4;
+        let seen = std::sync::Arc::new(parking_lot::Mutex::new(Vec::new()));
+        
+        let mut checker = TLAChecker::new(max_history);
+        checker.add_spec(Box::new(HistoryRecorder { seen: seen.clone() }));
+        
+        let checks = 3 * max_history as u64 + 1;
+        for clock in 0..checks {
+            let mut state = State::new();
+            state.clock = clock;
+            checker.check_all(&state).unwrap();
+        }
+        
+        let seen = seen.lock();
+        assert_eq!(seen.len(), checks as usize);
+        for (clock, history) in seen.iter().enumerate() {
+            let clock = clock as u64;
+            let first = (clock + 1).saturating_sub(max_history as u64);
+            let expected: Vec<u64> = (first..=clock).collect();
+            assert_eq!(history, &expected);
+        }
+    }
 }
@@ -127,17 +127,17 @@ async fn demo_3_persistence() {
     let mut wal = WAL::create(temp_dir.path().join("wal"), WALConfig::default()).unwrap();
     
     println!("Writing 1000 entries to WAL...");
-    for i in 0..1000 {
-        let entry = lattice::storage::WALEntry::LogEntry {
+    let entries: Vec<_> = (0..1000)
+        .map(|i| lattice::storage::WALEntry::LogEntry {
             index: i,
             term: 1,
             transition: Transition::Write {
                 key: format!("k{}", i),
                 value: vec![i as u8],
             },
-        };
-        wal.append(entry).unwrap();
-    }
+        })
+        .collect();
+    wal.append_batch(&entries).unwrap();
     
     println!("✅ WAL written and synced to disk");
     println!();
@@ -29,6 +29,12 @@ describe('StateMachine', () => {
         expect(machine.getHistory()).toEqual(['idle', 'running']);
     });
 
+    it('should report valid and invalid transitions', () => {
+        expect(machine.canTransition('idle', 'running')).toBe(true);
+        expect(machine.canTransition('error', 'running')).toBe(false);
+        expect(machine.canTransition('idle', 'unknown')).toBe(false);
+    });
+
     it('should fail to transition to an invalid target state', async () => {
         // @ts-expect-error - testing runtime validation for invalid transition
         const result = await machine.transition('invalid');
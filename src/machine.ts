@@ -25,6 +25,7 @@ export class StateMachine<
   private readonly definition: StateMachineDefinition<TConfig, TContext>;
   private state: MachineState<TConfig, TContext>;
   private transitions: Map<string, Transition<TConfig, TContext, any, any>[]>;
+  private readonly validTargets: Map<string, ReadonlySet<string>>;
   private onTransitionCallbacks: Array<
     (result: TransitionResult<TConfig, TContext>) => void
   >;
@@ -34,6 +35,13 @@ export class StateMachine<
     this.transitions = new Map();
     this.onTransitionCallbacks = [];
 
+    // Precompute target sets so canTransition is a hash lookup, not an array scan
+    this.validTargets = new Map(
+      Object.entries(definition.config).map(
+        ([state, targets]) => [state, new Set(targets)] as [string, ReadonlySet<string>]
+      )
+    );
+
     // Initialize state
     this.state = {
       value: definition.initial,
@@ -71,9 +79,8 @@ export class StateMachine<
     from: TFrom,
     to: string
   ): boolean {
-    const config = this.definition.config as any;
-    const validTargets = config[from as string];
-    return validTargets && validTargets.includes(to);
+    const targets = this.validTargets.get(from as string);
+    return targets !== undefined && targets.has(to);
   }
 
   /**